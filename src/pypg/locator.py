@@ -25,8 +25,9 @@ def strict(typedict: dict[str, type], fully_qualified_name: str):
 
 def allow_subclass(typedict: dict[str, type], fully_qualified_name: str):
     t: type = _locate(fully_qualified_name)
-    if any(issubclass(t, allowed) for allowed in typedict.values()):
+    if issubclass(t, tuple(typedict.values())):
         return t
+    _disallow(fully_qualified_name)
 
 
 _special_cases = {
@@ -43,11 +44,25 @@ class Locator:
             get_fully_qualified_name(allowed_type): allowed_type
             for allowed_type in allowed
         }
+        self.__located: dict[str, type] = {}
 
     def allow(self, t: type):
-        self.__allowed[get_fully_qualified_name(t)] = t
+        fully_qualified_name = get_fully_qualified_name(t)
+        self.__allowed[fully_qualified_name] = t
+        # t may replace a type already located under the same name.
+        self.__located.pop(fully_qualified_name, None)
 
     def __call__(self, fully_qualified_name: str):
+        try:
+            return self.__located[fully_qualified_name]
+        except KeyError:
+            pass
+        result = self.__locate(fully_qualified_name)
+        if result is not None:
+            self.__located[fully_qualified_name] = result
+        return result
+
+    def __locate(self, fully_qualified_name: str):
         if self.__load_policy:
             return self.__load_policy(self.__allowed, fully_qualified_name)
         else:
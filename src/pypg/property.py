@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import itertools
 from abc import ABC, abstractmethod, ABCMeta
-from functools import cached_property, wraps
+from functools import partial, wraps
 from types import FunctionType
 from typing import Any, Callable, Generic, Iterable, Protocol, Self, TypeVar
 
@@ -19,21 +19,22 @@ class PropertyType(ABCMeta):
     """
 
     def __new__(mcs, name: str, bases: tuple[type], attrs: dict[str, Any]):
-        properties = [p for p in attrs.values() if isinstance(p, Property)]
+        # dict as an ordered set, deduplicating Properties inherited through
+        # more than one base.
+        properties = dict.fromkeys(filter(_is_property, attrs.values()))
         for b in bases:
             if issubclass(type(b), PropertyType):
-                for p in b.properties:
-                    if p not in properties:
-                        properties.append(p)
+                properties.update(dict.fromkeys(b.properties))
 
         cls = super().__new__(
             mcs,
             name,
             bases,
-            {**attrs, "properties": properties},
+            {**attrs, "properties": tuple(properties)},
         )
         for p in cls.properties:
             p.__bind_subclass__(cls)
+        setattr(cls, _initialized_key, mcs.__initialized_properties(cls))
         cls.__create_initializer(cls)
         return cls
 
@@ -41,70 +42,173 @@ class PropertyType(ABCMeta):
 
     @classmethod
     def __create_initializer(mcs, cls: PropertyType):
+        if not cls.properties:
+            # nothing to initialize; keep the inherited __init__ as-is.
+            return
         cls_init = cls.__init__
+        inherited = "__init__" not in cls.__dict__ and getattr(
+            cls_init, "_initializes_properties", False
+        )
+        if inherited:
+            cls_init = cls_init._wrapped_init
+        # user-defined initializers may re-enter a generated initializer
+        # through super(), which requires an _InitializationContext.
+        plan = (
+            mcs.__direct_init_plan(cls)
+            if cls_init in (object.__init__, PropertyClass.__init__)
+            else None
+        )
+        if inherited and plan is None:
+            # the inherited initializer already initializes the Properties of
+            # type(instance); keep it as-is.
+            return
 
         def initializer(instance: PropertyClass, *args, **property_values):
-            with _InitializationContext(
-                instance, **property_values
+            with _InitializationContext.get_or_create(
+                instance, property_values
             ) as init_ctx:
                 init_ctx.initialize()
                 cls_init(instance, *args, **init_ctx.config)
 
+        if plan is not None:
+            generic_initializer = initializer
+
+            def initializer(
+                instance: PropertyClass, *args, **property_values
+            ):
+                if type(instance) is not cls:
+                    return generic_initializer(
+                        instance, *args, **property_values
+                    )
+                instance_dict = instance.__dict__
+                for name, attribute_key, default in plan:
+                    instance_dict[attribute_key] = property_values.pop(
+                        name, default
+                    )
+                cls_init(instance, *args, **property_values)
+
+        initializer._initializes_properties = True
+        initializer._wrapped_init = cls_init
         cls.__init__ = initializer
 
+    @staticmethod
+    def __direct_init_plan(
+        cls: PropertyType,
+    ) -> tuple[tuple[str, str, Any], ...] | None:
+        """
+        Returns: (name, attribute_key, default) for each Property cls
+            initializes if all of them can be initialized by storing their
+            value directly, otherwise None.
+        """
+        # storing values directly would bypass a custom __setattr__, or an
+        # attribute of cls shadowing an inherited Property.
+        if cls.__setattr__ is not object.__setattr__:
+            return None
+        properties = getattr(cls, _initialized_key)
+        if any(_lookup(cls, p.name) is not p for p in properties):
+            return None
+        plan = tuple(p._direct_init_entry(cls) for p in properties)
+        return None if None in plan else plan
+
+    @staticmethod
+    def __initialized_properties(cls: PropertyType) -> tuple[Property, ...]:
+        """
+        Returns: the Properties of cls initialized on construction; one per
+            name, being the Property that name resolves to on cls if it is
+            one of them, else the first declared.
+        """
+        by_name: dict[str, Property] = {}
+        for p in cls.properties:
+            by_name.setdefault(p.name, p)
+        for name in by_name:
+            resolved = _lookup(cls, name)
+            if resolved in cls.properties:
+                by_name[name] = resolved
+        return tuple(by_name.values())
+
     def intrinsic_traits(cls) -> Iterable[Trait]:
         return ()
 
 
-class _InitMeta(type):
-    _active: dict[PropertyClass, _InitializationContext] = {}
+_unset = object()
+
+# the Properties each PropertyType initializes are stored in its __dict__
+# under a key that cannot collide with an attribute name.
+_initialized_key = "#_initialized_properties"
 
-    def __call__(cls, instance, **property_values):
+
+def _lookup(cls: type, name: str) -> Any:
+    """
+    Returns: the attribute name resolves to on cls, without invoking its
+        descriptor protocol, or _unset if there is none.
+    """
+    for c in cls.__mro__:
         try:
-            return cls._active[instance]
+            return c.__dict__[name]
         except KeyError:
-            ctx = cls.__new__(cls, instance, **property_values)
-            ctx.__init__(instance, **property_values)
-            cls._active[instance] = ctx
-            return ctx
+            pass
+    return _unset
+
+# the active _InitializationContext is stored in the instance's __dict__ under
+# a key that cannot collide with an attribute name.
+_init_context_key = "#_init_context"
 
 
-class _InitializationContext(metaclass=_InitMeta):
+class _InitializationContext:
+    __slots__ = ("_instance", "config", "_uninitialized", "__entry_count")
+
     def __init__(
-        self, instance: PropertyClass, **property_values: dict[str, Any]
+        self, instance: PropertyClass, property_values: dict[str, Any]
     ):
         self._instance = instance
         self.config = property_values
-        self._uninitialized = [*type(instance).properties]
+        # dict as an ordered set: removal by key is O(1).
+        self._uninitialized = dict.fromkeys(
+            getattr(type(instance), _initialized_key)
+        )
         self.__entry_count = 0
 
     def __enter__(self):
         if not self.__entry_count:
-            type(self)._active[self._instance] = self
+            self._instance.__dict__[_init_context_key] = self
         self.__entry_count += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.__entry_count -= 1
         if not self.__entry_count:
-            type(self)._active.pop(self._instance)
+            del self._instance.__dict__[_init_context_key]
 
     def init_property(self, p: Property):
-        try:
-            value = self.config.pop(p.name)
-        except KeyError:
+        value = self.config.pop(p.name, _unset)
+        if value is _unset:
             value = p.create_default_value(self._instance)
         p.__init_instance__(self._instance, value)
-        self._uninitialized.remove(p)
+        del self._uninitialized[p]
 
     @classmethod
     def for_instance(cls, instance: PropertyClass) -> _InitializationContext:
-        return cls._active[instance]
+        return instance.__dict__[_init_context_key]
+
+    @classmethod
+    def get_or_create(
+        cls, instance: PropertyClass, property_values: dict[str, Any]
+    ) -> _InitializationContext:
+        """
+        Returns: the context already initializing instance, or a new one
+            using property_values if there is none.
+        """
+        try:
+            return instance.__dict__[_init_context_key]
+        except KeyError:
+            ctx = instance.__dict__[_init_context_key] = cls(
+                instance, property_values
+            )
+            return ctx
 
     def initialize(self):
         while self._uninitialized:
-            p = self._uninitialized[0]
-            self.init_property(p)
+            self.init_property(next(iter(self._uninitialized)))
 
 
 class Factory(Protocol[T]):
@@ -115,34 +219,28 @@ class Factory(Protocol[T]):
 
 
 class FunctionReference(Generic[T]):
+    __slots__ = ("_func", "_args", "_kwargs")
+
     def __init__(self, func: Protocol[T], *args, **kwargs):
         self._func = func
         self._args = args
         self._kwargs = kwargs
 
-    def _get_call_params(self, args, kwargs):
-        if args:
-            args = (*args, *self._args)
-        else:
-            args = self._args
-
-        if kwargs:
-            kw = self._kwargs.copy()
-            kw.update(kwargs)
-            kwargs = kw
-        else:
-            kwargs = self._kwargs
-        return args, kwargs
-
     def __call__(self, *args, **kwargs) -> T:
-        args, kwargs = self._get_call_params(args, kwargs)
+        if self._args or self._kwargs:
+            return self._func(
+                *args, *self._args, **{**self._kwargs, **kwargs}
+            )
         return self._func(*args, **kwargs)
 
 
 class MethodReference(FunctionReference[T]):
+    __slots__ = ()
+
     def __call__(self, instance: PropertyClass, *args, **kwargs) -> T:
         bound = getattr(instance, self._func.__name__)
-        args, kwargs = self._get_call_params(args, kwargs)
+        if self._args or self._kwargs:
+            return bound(*args, *self._args, **{**self._kwargs, **kwargs})
         return bound(*args, **kwargs)
 
 
@@ -270,7 +368,8 @@ class Setter(Protocol):
 
 class _PropertyMeta(type):
     def __instancecheck__(cls, instance):
-        if isinstance(instance, _Proxy):
+        # _Proxy is never subclassed, so an exact type check suffices.
+        if type(instance) is _Proxy:
             instance = instance._property
         return super().__instancecheck__(instance)
 
@@ -283,6 +382,14 @@ class _PropertyMeta(type):
 TraitProvider = Trait | classmethod
 
 
+def _is_property(obj: Any) -> bool:
+    """
+    Equivalent to isinstance(obj, Property), without the Python-level
+    _PropertyMeta.__instancecheck__ call for objects that are not Properties.
+    """
+    return type(obj) is _Proxy or type.__instancecheck__(Property, obj)
+
+
 def is_method(cls: type, obj: Any) -> bool:
     return (
         isinstance(obj, (FunctionType, classmethod, staticmethod))
@@ -296,6 +403,22 @@ class Property(Generic[T], metaclass=_PropertyMeta):
     declaring metadata and behaviors triggered by data-access.
     """
 
+    __slots__ = (
+        "__orig_class__",
+        "_subclass_proxies",
+        "_direct_getters",
+        "_direct_setters",
+        "__default",
+        "__default_is_factory",
+        "name",
+        "attribute_key",
+        "__declaring_type",
+        "_getter",
+        "_setter",
+        "__traits",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         default: DEFAULT_TYPES = None,
@@ -327,26 +450,41 @@ class Property(Generic[T], metaclass=_PropertyMeta):
         """
         super().__init__()
         self._subclass_proxies: dict[PropertyType, _Proxy] = {}
+        self._direct_getters: dict[PropertyType, Getter[T]] = {}
+        self._direct_setters: dict[PropertyType, Setter[T]] = {}
         self._default = default
         self.name = None
         self.__declaring_type: PropertyType = None
         self._getter = self.default_getter if getter is None else getter
         self._setter = self.default_setter if setter is None else setter
-        self.__traits = tuple(
-            filter(None, traits if isinstance(traits, Iterable) else [traits]),
-        )
+        if traits is None or isinstance(traits, TraitProvider):
+            traits = (traits,)
+        self.__traits = tuple(filter(None, traits))
 
     @property
     def declaring_type(self):
         return self.__declaring_type
 
-    @cached_property
+    @property
+    def _default(self) -> DEFAULT_TYPES:
+        return self.__default
+
+    @_default.setter
+    def _default(self, default: DEFAULT_TYPES):
+        self.__default = default
+        # resolved once here rather than on every instance construction.
+        self.__default_is_factory = isinstance(
+            default, (FunctionReference, Callable)
+        )
+
+    @property
     def value_type(self):
         return self.__orig_class__.__args__[0]
 
     def __set_name__(self, owner, name):
         self.name = name
         self.__declaring_type = owner
+        self.attribute_key = f"#_{owner.__name__}__{name}"
         for t in self.traits:
             try:
                 t.__bind__(self)
@@ -358,7 +496,13 @@ class Property(Generic[T], metaclass=_PropertyMeta):
         return self.__declaring_type
 
     def __bind_subclass__(self, cls):
-        self._subclass_proxies[cls] = _Proxy(self, cls)
+        proxy = self._subclass_proxies[cls] = _Proxy(self, cls)
+        # instances of subclasses without data-modifying traits bypass the
+        # proxy.
+        if not any(isinstance(t, PostGet) for t in proxy.traits):
+            self._direct_getters[cls] = self._getter
+        if not any(isinstance(t, (PreSet, PostSet)) for t in proxy.traits):
+            self._direct_setters[cls] = self._setter
 
     def __init_instance__(self, instance: PropertyClass, value):
         """
@@ -371,6 +515,23 @@ class Property(Generic[T], metaclass=_PropertyMeta):
         proxy = self._subclass_proxies[type(instance)]
         proxy.__init_instance__(instance, value)
 
+    def _direct_init_entry(
+        self, owner: PropertyType
+    ) -> tuple[str, str, Any] | None:
+        """
+        Returns: (name, attribute_key, default) if instances of owner may
+            initialize this Property by storing its value in their __dict__,
+            i.e. it has no Traits, a literal default and the default setter;
+            otherwise None.
+        """
+        if (
+            self.__default_is_factory
+            or self._setter != self.default_setter
+            or self._subclass_proxies[owner].traits
+        ):
+            return None
+        return self.name, self.attribute_key, self.__default
+
     def create_default_value(self, instance) -> T:
         """
         Return the value used in construction of instance if no keyword
@@ -381,15 +542,11 @@ class Property(Generic[T], metaclass=_PropertyMeta):
             a default of this property for the instance provided.
         """
         return (
-            self._default(instance)
-            if isinstance(self._default, (FunctionReference, Callable))
-            else self._default
+            self.__default(instance)
+            if self.__default_is_factory
+            else self.__default
         )
 
-    @cached_property
-    def attribute_key(self):
-        return f"#_{self.__declaring_type.__name__}__{self.name}"
-
     def default_getter(self, instance) -> T:
         """
         The getter method used by a Property if none is otherwise provided. It
@@ -404,12 +561,8 @@ class Property(Generic[T], metaclass=_PropertyMeta):
 
         try:
             return instance.__dict__[self.attribute_key]
-        except KeyError as k:
-            init_ctx = None
-            try:
-                init_ctx = _InitializationContext.for_instance(instance)
-            except KeyError as k:
-                pass
+        except KeyError:
+            init_ctx = instance.__dict__.get(_init_context_key)
             if init_ctx is None:
                 raise AttributeError(
                     f"object {instance} as no property {self}",
@@ -430,11 +583,19 @@ class Property(Generic[T], metaclass=_PropertyMeta):
         instance.__dict__[self.attribute_key] = value
 
     def __get__(self, instance: PropertyClass, owner: PropertyType):
+        if instance is not None:
+            getter = self._direct_getters.get(owner)
+            if getter is not None:
+                return getter(instance)
         proxy = self._subclass_proxies[owner]
         return proxy if instance is None else proxy.__get__(instance, owner)
 
     def __set__(self, instance, value):
-        self._subclass_proxies[type(instance)].__set__(instance, value)
+        setter = self._direct_setters.get(type(instance))
+        if setter is None:
+            self._subclass_proxies[type(instance)].__set__(instance, value)
+        else:
+            setter(instance, value)
 
     def get(self, instance) -> T:
         """
@@ -447,6 +608,18 @@ class Property(Generic[T], metaclass=_PropertyMeta):
         """
         return getattr(instance, self.name)
 
+    def getter_for(self, owner: PropertyType) -> Getter[T]:
+        """
+        Returns: a callable retrieving the value of this Property from an
+            instance of owner with owner's Traits applied, bypassing
+            attribute lookup.
+        """
+        getter = self._direct_getters.get(owner)
+        if getter is None:
+            proxy = self._subclass_proxies[owner]
+            getter = partial(proxy.__get__, owner=owner)
+        return getter
+
     def set(self, instance, value):
         """
             Convenience method to use Property set-semantics functionally.
@@ -479,14 +652,23 @@ class _Proxy:
 
     __qualname__ = Property.__qualname__
     __name__ = Property.__name__
+    __slots__ = (
+        "_property",
+        "__owner",
+        "__traits",
+        "__post_get",
+        "__pre_set",
+        "__post_set",
+    )
 
     def __init__(self, p: Property, owner: type[PropertyClass]):
         self._property = p
         self.__owner = owner
-        self.__traits = tuple(
-            itertools.chain.from_iterable(
+        self.__traits = (
+            *itertools.chain.from_iterable(
                 map(self.__get_traits, self._property.traits),
-            )
+            ),
+            *self.__get_value_type_traits(p),
         )
 
         self.__post_get = tuple(
@@ -516,15 +698,32 @@ class _Proxy:
             else:
                 yield from result
 
+    @staticmethod
+    def __get_value_type_traits(p: Property) -> Iterable[Trait]:
+        try:
+            value_type = p.value_type
+        except AttributeError:
+            return ()
+        return (
+            value_type.intrinsic_traits()
+            if issubclass(type(value_type), PropertyType)
+            else ()
+        )
+
     @wraps(Property.get)
     def __get__(self, instance, owner):
         result = self._property._getter(instance)
+        if not self.__post_get:
+            return result
         for t in self.__post_get:
             result = t.apply(instance, result)
         return result
 
     @wraps(Property.set)
     def __set__(self, instance, value):
+        if not (self.__pre_set or self.__post_set):
+            self._property._setter(instance, value)
+            return
         for t in self.__pre_set:
             value = t.apply(instance, value)
         self._property._setter(instance, value)
@@ -537,18 +736,10 @@ class _Proxy:
             t.__init_instance__(instance, value)
         self.set(instance, value)
 
-    @cached_property
-    def _value_type_traits(self):
-        return (
-            self.value_type.intrinsic_traits()
-            if issubclass(type(self._property.value_type), PropertyType)
-            else ()
-        )
-
     @property
     @wraps(Property.traits.fget)
     def traits(self):
-        return tuple((*self.__traits, *self._value_type_traits))
+        return self.__traits
 
     def __str__(self):
         return (
@@ -1,62 +1,113 @@
+from collections.abc import Callable, Iterable
+from operator import attrgetter
 from typing import Any
 
 from pypg import Property, PropertyClass, PropertyType, Trait
 from pypg.traits.metadata import MetadataTrait
 from pypg.transcode import Decoder, Encoder
 
+PropertyGetters = tuple[tuple[str, Callable[[Any], Any]], ...]
+
+# getters are cached in each PropertyType's own __dict__ under this key, by
+# Encoder type, so that they are released along with the PropertyType.
+_getters_key = "#_property_getters"
+
 
 class PropertyClassEncoder(Encoder, handler_for=PropertyClass):
+    __slots__ = ()
+
     def _encode(self, obj: PropertyClass):
         return {
-            p.name: Encoder(p.get(obj), self, self.overrides).obj_data
-            for p in type(obj).properties
+            name: self._pack_child(get(obj))
+            for name, get in self._property_getters(type(obj))
         }
 
+    @classmethod
+    def _encoded_properties(
+        cls, obj_type: PropertyType
+    ) -> Iterable[Property]:
+        """
+        Returns: the Properties of obj_type whose values are encoded.
+        """
+        return obj_type.properties
+
+    @classmethod
+    def _property_getters(cls, obj_type: PropertyType) -> PropertyGetters:
+        """
+        Returns: (name, getter) pairs for each encoded Property of obj_type,
+            computed once per Encoder and PropertyType. Where a Property is
+            redeclared by a subclass, the getter reads the one that
+            attribute lookup on obj_type resolves to.
+        """
+        cache = obj_type.__dict__.get(_getters_key)
+        if cache is None:
+            cache = {}
+            setattr(obj_type, _getters_key, cache)
+        try:
+            return cache[cls]
+        except KeyError:
+            names = dict.fromkeys(
+                p.name for p in cls._encoded_properties(obj_type)
+            )
+            getters = cache[cls] = tuple(
+                (name, cls._getter(obj_type, name)) for name in names
+            )
+            return getters
+
+    @staticmethod
+    def _getter(obj_type: PropertyType, name: str) -> Callable[[Any], Any]:
+        attr = getattr(obj_type, name)
+        if isinstance(attr, Property):
+            return attr.getter_for(obj_type)
+        return attrgetter(name)
+
 
 class PropertyClassDecoder(Decoder, handler_for=PropertyClass):
+    __slots__ = ()
+
     def _decode(self, obj_type: type, property_values: dict[str, Any]) -> Any:
+        decode_child = self._decode_child
         return obj_type(
             **{
-                name: Decoder(
-                    attr,
-                    self.locator,
-                    self,
-                    overrides=self.overrides,
-                ).instance
+                name: decode_child(attr)
                 for name, attr in property_values.items()
             }
         )
 
 
 class PropertyEncoder(Encoder, handler_for=Property):
+    __slots__ = ()
+
     def _encode(self, p: Property):
         return {
-            "value_type": Encoder(p.value_type, self, self.overrides).obj_data,
-            "traits": [
-                Encoder(t, self, self.overrides).obj_data for t in p.traits
-            ],
+            "value_type": self._pack_child(p.value_type),
+            "traits": [self._pack_child(t) for t in p.traits],
         }
 
 
 class TraitEncoder(Encoder, handler_for=Trait):
+    __slots__ = ()
+
     def _encode(self, obj):
         return str(obj)
 
 
 class MetadataTraitEncoder(Encoder, handler_for=MetadataTrait):
+    __slots__ = ()
+
     def _encode(self, obj: MetadataTrait):
-        return {"value": Encoder(obj.value, self, self.overrides).obj_data}
+        return {"value": self._pack_child(obj.value)}
 
 
 class PropertyTypeEncoder(Encoder, handler_for=PropertyType):
+    __slots__ = ()
+
     @classmethod
     def _get_obj_type(cls, obj: PropertyType):
         return obj
 
     def _encode(self, ptype: PropertyType):
         return {
-            p.name: Encoder(
-                getattr(ptype, p.name), self, self.overrides
-            ).obj_data
+            p.name: self._pack_child(getattr(ptype, p.name))
             for p in ptype.properties
         }
@@ -48,10 +48,8 @@ class AllowedRange(Validated, metaclass=_AllowedRangeMeta):
     def check_range(self, instance: PropertyClass, value: float):
         min_val = self.minimum(instance)
         max_val = self.maximum(instance)
-        min_check = min_val, self.min_cmp
-        max_check = max_val, self.max_cmp
-        if not all(
-            bound is None or cmp(value, bound) for bound, cmp in (min_check, max_check)
+        if (min_val is not None and not self.min_cmp(value, min_val)) or (
+            max_val is not None and not self.max_cmp(value, max_val)
         ):
             raise ValueError(
                 f"{value} outside allowed range for {self.subject}: {min_val},{max_val}"
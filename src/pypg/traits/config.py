@@ -1,16 +1,27 @@
 import json
+from collections.abc import Iterable
+from weakref import WeakKeyDictionary
 
-from pypg import Encoder, encode, MetadataTrait
+from pypg import encode, MetadataTrait
 from pypg.property import PropertyClass, Property, PropertyType
 from pypg.property_transcoder import PropertyClassEncoder
 
 
 class ConfigEncoder(PropertyClassEncoder):
-    def _encode(self, obj: PropertyClass):
-        return {
-            p.name: Encoder(p.get(obj), self, self.overrides).obj_data
-            for p in filter(Config.has_config_data, type(obj).properties)
-        }
+    __slots__ = ()
+
+    @classmethod
+    def _encoded_properties(
+        cls, obj_type: PropertyType
+    ) -> Iterable[Property]:
+        return filter(Config.has_config_data, obj_type.properties)
+
+
+# results by Property, then Config type; weakly keyed so that neither the
+# Properties nor the types declaring them are kept alive.
+_config_cache: WeakKeyDictionary[Property, dict[type, bool]] = (
+    WeakKeyDictionary()
+)
 
 
 class Config(MetadataTrait):
@@ -22,18 +33,28 @@ class Config(MetadataTrait):
         return encode(obj, overrides={PropertyClass: ConfigEncoder})
 
     @classmethod
-    def has_config_data(cls, p: Property):
+    def has_config_data(cls, p: Property) -> bool:
+        by_type = _config_cache.setdefault(p, {})
+        try:
+            return by_type[cls]
+        except KeyError:
+            result = by_type[cls] = cls._find_config_data(p)
+            return result
+
+    @classmethod
+    def _find_config_data(cls, p: Property) -> bool:
         for pt in p.traits:
             if isinstance(pt, Config):
-                return pt.value
+                return bool(pt.value)
         if issubclass(type(p.value_type), PropertyType):
             p_val_type: PropertyType = p.value_type
             return any(filter(cls.has_config_data, p_val_type.properties))
+        return False
 
     @classmethod
     def to_file(cls, obj, path: str):
         with open(path, 'w') as file:
-            json.dump(cls.encode(obj), file)
+            file.write(cls.to_string(obj))
 
     @classmethod
     def to_string(cls, obj) -> str:
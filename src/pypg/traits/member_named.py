@@ -14,7 +14,7 @@ class MemberNamed(Trait):
 
 
 def affix_index(basename, items):
-    return [f"{basename} {i}" for i, item in enumerate(items)]
+    return (f"{basename} {i}" for i in range(len(items)))
 
 
 class MemberNameElements(MemberNamed):
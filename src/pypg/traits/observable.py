@@ -11,9 +11,9 @@ __all__ = [
     "watch",
 ]
 from abc import ABC, abstractmethod
-from collections import deque
 from collections.abc import Callable
-from threading import Event, Lock, Thread
+from queue import Empty, SimpleQueue
+from threading import Event, Lock, Thread, current_thread
 from typing import Any
 
 from pypg import Property, PropertyClass
@@ -46,77 +46,158 @@ class SynchronousDelivery(DeliveryPolicy):
             self._on_update(value)
 
 
+class _DeliveryMarker(Event):
+    """
+    Queued by AsynchronousDelivery.await_delivery, and set by the delivery
+    thread once every value queued ahead of it has been delivered.
+    """
+
+
 class AsynchronousDelivery(DeliveryPolicy):
+    # posted to the delivery queue to stop the delivery thread.
+    _STOP = object()
+
     def cancel(self):
-        self._canceled = True
+        with self._data_lock:
+            self._canceled = True
+            if self._delivery_thread is not None:
+                self._data_queue.put(self._STOP)
 
     def update(self, value):
-        self._data_queue.append(value)
-        with self._data_lock:
-            self._queue_empty_event.clear()
-            if not self._delivery_thread:
-                self._delivery_thread = Thread(target=self._deliver_queue, daemon=True)
-                self._delivery_thread.start()
+        if self._canceled:
+            return
+        self._data_queue.put(value)
+        if self._delivery_thread is None:
+            with self._data_lock:
+                if self._delivery_thread is None:
+                    self._delivery_thread = Thread(
+                        target=self._deliver_queue, daemon=True
+                    )
+                    self._delivery_thread.start()
 
     def await_delivery(self, timeout: float | None = None):
-        return self._queue_empty_event.wait(timeout)
+        """
+        Wait until every value passed to update before this call has been
+        delivered.
+        Returns:
+            False if the timeout expired first, else True. Returns True
+            immediately if no delivery is in progress or delivery has been
+            canceled.
+        """
+        with self._data_lock:
+            if self._canceled or self._delivery_thread is None:
+                return True
+            delivered = _DeliveryMarker()
+            self._data_queue.put(delivered)
+        return delivered.wait(timeout)
 
     def _deliver_queue(self):
-        while not self._canceled:
+        data_queue = self._data_queue
+        while True:
             try:
-                value = self._data_queue.popleft()
-                if self._update_policy.requires_update(value):
-                    try:
-                        self._on_update(value)
-                    except Exception as e:
-                        self._on_error(value, e)
-            except IndexError:
+                value = data_queue.get(timeout=self._idle_timeout)
+            except Empty:
                 with self._data_lock:
-                    if self._data_queue:  # pragma: no cover
-                        continue
-                    self._queue_empty_event.set()
+                    # cleared before the queue is re-checked: a concurrent
+                    # update either finds no thread and starts one, or its
+                    # value is found here.
                     self._delivery_thread = None
-                    return
+                    if data_queue.empty():
+                        return
+                    self._delivery_thread = current_thread()
+                continue
+            if type(value) is _DeliveryMarker:
+                # set even after cancellation, as its caller may already be
+                # waiting on it.
+                value.set()
+            elif value is self._STOP or self._canceled:
+                self._release()
+                return
+            elif self._update_policy.requires_update(value):
+                try:
+                    self._on_update(value)
+                except Exception as e:
+                    self._on_error(value, e)
+
+    def _release(self):
+        """
+        Detach the delivery thread after cancellation, discarding undelivered
+        values and releasing any callers of await_delivery.
+        """
+        with self._data_lock:
+            self._delivery_thread = None
+            while not self._data_queue.empty():
+                value = self._data_queue.get_nowait()
+                if type(value) is _DeliveryMarker:
+                    value.set()
 
     def __init__(
         self,
         on_update: Callable[[Any], Any],
         update_policy: UpdatePolicy,
         on_error: Callable[[Any, Exception], Any] = print,
+        idle_timeout: float | None = 5.0,
     ):
         super().__init__(on_update, update_policy)
+        # seconds the delivery thread waits for a value before exiting, or
+        # None to keep it until cancel(). Longer timeouts spare bursts spaced
+        # further apart from starting a new thread, at the cost of holding an
+        # idle thread, and the policy it delivers for, for that long.
+        self._idle_timeout = idle_timeout
         self._canceled = False
+        # guards starting, exiting and canceling the delivery thread.
         self._data_lock = Lock()
         self._on_error = on_error
-        self._data_queue = deque()
+        self._data_queue = SimpleQueue()
         self._delivery_thread = None
-        self._queue_empty_event = Event()
 
 
 class UpdatePolicy(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def requires_update(self, value) -> bool:
         """determines whether a given value requires an update to be broadcast to observers."""
 
 
 class Always(UpdatePolicy):
+    __slots__ = ()
+
     def requires_update(self, value):
         return True
 
 
 class OnChange(UpdatePolicy):
+    __slots__ = ("_last",)
+
     _UNCHANGED = object()
-    _last = _UNCHANGED
+
+    def __init__(self):
+        self._last = self._UNCHANGED
 
     def requires_update(self, value):
-        result = value != self._last
+        # subclasses may not call __init__, leaving _last unset.
+        last = getattr(self, "_last", self._UNCHANGED)
+        if value is last:
+            return False
         self._last = value
-        return result
+        return value != last
+
+
+# watchlists are immutable tuples, replaced rather than mutated when a
+# subscription is added or cancelled, so that apply may iterate them without
+# locking; only the replacement itself is serialized.
+_watchlist_lock = Lock()
 
 
 class Observable(DataModifierMixin, ABC):
+    def __bind__(self, subject: Property):
+        super().__bind__(subject)
+        # resolved once here, as apply runs on every access of the subject.
+        self._watchlist_key = self.watchlist_key(subject)
+
     def __init_instance__(self, instance: PropertyClass, _):
-        setattr(instance, self.watchlist_key(self.subject), [])
+        setattr(instance, self._watchlist_key, ())
 
     @classmethod
     def watchlist_key(cls, p: Property):
@@ -127,9 +208,11 @@ class Observable(DataModifierMixin, ABC):
         return getattr(instance, cls.watchlist_key(p))
 
     def apply(self, instance, value) -> Any:
-        watchlist: list[DeliveryPolicy] = self.get_watchlist(
-            instance, self.subject
-        )
+        watchlist: tuple[DeliveryPolicy, ...] = instance.__dict__[
+            self._watchlist_key
+        ]
+        if not watchlist:
+            return value
         for udp in watchlist:
             udp.update(value)
         return value
@@ -143,25 +226,39 @@ class Observable(DataModifierMixin, ABC):
     ) -> Subscription:
         if isinstance(p, str):
             p: Property = getattr(type(instance), p)
-        watchlist = cls.get_watchlist(instance, p)
-        watchlist.append(delivery_policy)
-        return Subscription(delivery_policy, watchlist)
+        key = cls.watchlist_key(p)
+        with _watchlist_lock:
+            setattr(instance, key, (*getattr(instance, key), delivery_policy))
+        return Subscription(delivery_policy, instance, key)
 
     def __str__(self):
         return str([get_fully_qualified_name(t) for t in self.modifier_triggers])
 
 class Subscription:
+    __slots__ = ("_delivery_policy", "_instance", "_watchlist_key")
+
     def __init__(
-        self, delivery_policy: DeliveryPolicy, watchlist: list[DeliveryPolicy]
+        self,
+        delivery_policy: DeliveryPolicy,
+        instance: PropertyClass,
+        watchlist_key: str,
     ):
         self._delivery_policy = delivery_policy
-        self._watchlist = watchlist
+        self._instance = instance
+        self._watchlist_key = watchlist_key
 
     def cancel(self):
-        try:
-            self._watchlist.remove(self._delivery_policy)
-        except ValueError:
-            pass
+        instance, key = self._instance, self._watchlist_key
+        with _watchlist_lock:
+            setattr(
+                instance,
+                key,
+                tuple(
+                    dp
+                    for dp in getattr(instance, key)
+                    if dp is not self._delivery_policy
+                ),
+            )
         self._delivery_policy.cancel()
 
     def __enter__(self):
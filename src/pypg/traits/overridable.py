@@ -3,23 +3,24 @@ from __future__ import annotations
 __all__ = ["Overridable"]
 
 import contextlib
-import itertools
-import threading
 from abc import abstractmethod
+from collections import defaultdict
 from functools import wraps
+from threading import get_native_id as _current_thread_id
+from typing import Self
 
 from pypg import Property, PropertyClass, PropertyType, Trait
 
 OverrideScope = PropertyType | PropertyClass | Property
 
 
-def _current_thread_id():
-    return threading.current_thread().native_id
-
-
 _threadid = int
 _context_count = int
 
+# collected traits are cached in each PropertyType's own __dict__ under this
+# key, by Trait type, so that they are released along with the PropertyType.
+_traits_key = "#_overridable_traits"
+
 
 class Overridable(Trait):
     def __init_subclass__(cls, **kwargs):
@@ -36,9 +37,9 @@ class Overridable(Trait):
 
     def __init__(self):
         super().__init__()
-        self._overrides: dict[
-            _threadid, dict[PropertyClass, _context_count]
-        ] = {}
+        self._overrides: defaultdict[
+            _threadid, defaultdict[PropertyClass, _context_count]
+        ] = defaultdict(lambda: defaultdict(int))
 
     class _Accessor:
         def __init__(self, override_target):
@@ -66,9 +67,8 @@ class Overridable(Trait):
                 )(instance, *args, **kwargs)
 
         def __get__(self, overridable: Overridable, owner):
-            try:
-                overrides = overridable._overrides[_current_thread_id()]
-            except KeyError:
+            overrides = overridable._overrides.get(_current_thread_id())
+            if overrides is None:
                 return self.override_target.__get__(
                     overridable, overridable.__class__
                 )
@@ -85,23 +85,18 @@ class Overridable(Trait):
     @contextlib.contextmanager
     def override(self, instance: PropertyClass = None):
         tid = _current_thread_id()
+        instance_dict = self._overrides[tid]
+        instance_dict[instance] += 1
         try:
-            instance_dict = self._overrides[tid]
-        except KeyError:
-            instance_dict = {instance: 0}
-            self._overrides[tid] = instance_dict
-        try:
-            instance_dict[instance] += 1
-        except KeyError:
-            instance_dict[instance] = 1
-        yield
-        count = instance_dict[instance] - 1
-        if not count:
-            instance_dict.pop(instance)
-            if not instance_dict:
-                self._overrides.pop(tid)
-        else:
-            instance_dict[instance] = count
+            yield
+        finally:
+            count = instance_dict[instance] - 1
+            if count:
+                instance_dict[instance] = count
+            else:
+                del instance_dict[instance]
+                if not instance_dict:
+                    del self._overrides[tid]
 
     @classmethod
     @contextlib.contextmanager
@@ -111,15 +106,27 @@ class Overridable(Trait):
             if isinstance(target, PropertyClass)
             else (None, target)
         )
-        ctxs = [
-            t.override(scope)
-            for t in itertools.chain.from_iterable(
-                (t for t in p.traits if isinstance(t, cls))
+        with contextlib.ExitStack() as stack:
+            for t in cls._collect_traits(target_type):
+                stack.enter_context(t.override(scope))
+            yield
+
+    @classmethod
+    def _collect_traits(cls, target_type: PropertyType) -> tuple[Self, ...]:
+        """
+        Returns: the Traits of type cls declared by target_type's Properties.
+        """
+        cache = target_type.__dict__.get(_traits_key)
+        if cache is None:
+            cache = {}
+            setattr(target_type, _traits_key, cache)
+        try:
+            return cache[cls]
+        except KeyError:
+            traits = cache[cls] = tuple(
+                t
                 for p in target_type.properties
+                for t in p.traits
+                if isinstance(t, cls)
             )
-        ]
-        for ctx in ctxs:
-            ctx.__enter__()
-        yield
-        for ctx in ctxs:
-            ctx.__exit__(None, None, None)
+            return traits
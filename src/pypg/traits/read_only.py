@@ -1,6 +1,6 @@
 from typing import Any
 
-from pypg import PreSet
+from pypg import PreSet, Property
 from pypg.traits import Overridable
 
 
@@ -8,11 +8,16 @@ class ReadOnly(Overridable, PreSet, override_target="apply"):
     def __init__(self):
         super().__init__()
 
+    def __bind__(self, subject: Property):
+        super().__bind__(subject)
+        # resolved once here, as apply runs on every assignment of the subject.
+        self._attribute_key = subject.attribute_key
+
     def _override(self, instance, value):
         return value
 
     def apply(self, instance, value) -> Any:
-        if self.subject.attribute_key in instance.__dict__:
+        if self._attribute_key in instance.__dict__:
             raise PermissionError(
                 f"{self.subject} of {instance} is read-only and cannot be reassigned."
             )
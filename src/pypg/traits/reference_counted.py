@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from functools import cached_property
+from functools import cached_property, partial
 from typing import Any
+from weakref import ref
 
 from pypg import PreSet, PropertyClass
 from pypg.property import DataModifierMixin
@@ -26,24 +27,38 @@ class ReferenceCounted(PropertyClass, ABC):
                 return None
 
     def _reference(self, instance: PropertyClass) -> None:
-        self.__composers.add(instance)
+        composers = self.__composers
+        key = id(instance)
+        if key not in composers:
+            # the callback holds this object weakly, so that a composer
+            # outliving it does not keep it alive either.
+            forget = partial(_forget_collected, ref(self), key)
+            composers[key] = ref(instance, forget)
 
     def _dereference(self, instance: PropertyClass) -> None:
-        self.__composers.remove(instance)
+        del self.__composers[id(instance)]
         if not self.__composers:
             self._on_unreferenced()
 
+    def _composer_collected(self, key: int) -> None:
+        if self.__composers.pop(key, None) is not None:
+            if not self.__composers:
+                self._on_unreferenced()
+
     @property
     def reference_count(self) -> int:
         return len(self.__composers)
 
     @property
     def composed_by(self) -> set[PropertyClass]:
-        return self.__composers.copy()
+        composers = (r() for r in self.__composers.values())
+        return {c for c in composers if c is not None}
 
     @cached_property
-    def __composers(self) -> set:
-        return set()
+    def __composers(self) -> dict[int, ref]:
+        # composers are held weakly, by id, so that composition alone does
+        # not keep them alive; collecting one dereferences it.
+        return {}
 
     @abstractmethod
     def _on_unreferenced(self):
@@ -55,3 +70,9 @@ class ReferenceCounted(PropertyClass, ABC):
     @classmethod
     def intrinsic_traits(cls):
         return (cls._ReferenceCounter(),)
+
+
+def _forget_collected(composed: ref, key: int, _) -> None:
+    composed = composed()
+    if composed is not None:
+        composed._composer_collected(key)
@@ -12,8 +12,10 @@ __all__ = [
 import json
 import typing
 from collections.abc import Collection, Iterable, Callable
+from copy import copy
 from datetime import datetime
 from enum import Enum
+from itertools import count
 from types import FunctionType, GenericAlias, MethodType, NoneType
 from typing import Any, Self, Union, _GenericAlias
 
@@ -26,8 +28,55 @@ Serializable = dict | list | Union[primitives]
 
 default_locator = Locator()
 
+_missing = object()
+
+
+class _Session:
+    """
+    State shared by every transcoder created with the same root.
+    """
+
+    __slots__ = ("handlers", "override_registry")
+
+    def __init__(
+        self,
+        overrides: dict[type, type[_Transcoder]] | None,
+        registry: TypeRegistry[type[_Transcoder]],
+    ):
+        self._resolve_with(overrides, registry)
+
+    def _resolve_with(
+        self,
+        overrides: dict[type, type[_Transcoder]] | None,
+        registry: TypeRegistry[type[_Transcoder]],
+    ):
+        if overrides:
+            self.handlers: dict[type, type[_Transcoder]] = {}
+            self.override_registry = TypeRegistry(overrides)
+        else:
+            # registered types resolve to their own handlers, so without
+            # overrides the session starts with them already resolved.
+            self.handlers = dict(registry)
+            self.override_registry = None
+
+    def with_overrides(
+        self,
+        overrides: dict[type, type[_Transcoder]] | None,
+        registry: TypeRegistry[type[_Transcoder]],
+    ) -> Self:
+        """
+        Returns:
+            a session sharing this one's state, except that handlers are
+            resolved with overrides instead.
+        """
+        session = copy(self)
+        session._resolve_with(overrides, registry)
+        return session
+
 
 class _Transcoder:
+    __slots__ = ("parent", "overrides", "session")
+
     _registry: TypeRegistry[_Transcoder] = None
 
     def __init_subclass__(
@@ -41,43 +90,114 @@ class _Transcoder:
 
     @classmethod
     def __class_getitem__(cls, obj_type: type) -> type[_Transcoder]:
+        # TypeRegistry caches the lookup until the registry changes.
         return cls._registry[obj_type:]
 
     @classmethod
-    def _resolve_handler(cls, obj_type, overrides: dict[type, type[Self]]):
+    def _resolve_handler(
+        cls, obj_type, overrides: TypeRegistry[type[Self]] | None
+    ):
         if overrides:
             try:
-                return TypeRegistry(overrides)[obj_type:]
+                return overrides[obj_type:]
             except KeyError:
                 pass
         return cls[obj_type]
 
+    @classmethod
+    def _cached_handler(
+        cls,
+        handlers: dict[type, type[Self]],
+        obj_type: type,
+        overrides: TypeRegistry[type[Self]] | None,
+    ) -> type[Self]:
+        try:
+            return handlers[obj_type]
+        except KeyError:
+            handler = handlers[obj_type] = cls._resolve_handler(
+                obj_type, overrides
+            )
+            return handler
+
+    @classmethod
+    def _child_session(
+        cls,
+        parent: _Transcoder,
+        overrides: dict[type, type[Self]] | None,
+    ) -> _Session:
+        """
+        Returns:
+            the session for a child of parent. A child given overrides other
+            than its parent's resolves handlers with them, while still sharing
+            the rest of the session.
+        """
+        if overrides is parent.overrides:
+            return parent.session
+        return parent.session.with_overrides(overrides, cls._registry)
+
+    @classmethod
+    def _new_handler(cls, obj_type: type, session: _Session) -> Self:
+        """
+        Construct the handler for obj_type. Handler resolution is cached for
+        the whole session.
+        """
+        handler = cls._cached_handler(
+            session.handlers, obj_type, session.override_registry
+        )
+        transcoder = object.__new__(handler)
+        transcoder.session = session
+        return transcoder
+
+
+class MonotonicID(dict[int, int]):
+    """
+    Default id provider: maps the id() of each object it is called with to
+    sequential integers, in order of first appearance.
+    """
+
+    __slots__ = ("_counter",)
 
-class MonotonicID:
     def __init__(self):
-        self.objects: dict[object, int] = {}
+        super().__init__()
+        self._counter = count()
+
+    def __missing__(self, key: int) -> int:
+        self[key] = objid = next(self._counter)
+        return objid
 
     def __call__(self, obj: object) -> int:
-        try:
-            return self.objects[id(obj)]
-        except KeyError:
-            self.objects[id(obj)] = (objid := len(self.objects))
-            return objid
+        return self[id(obj)]
+
+
+class _EncodeSession(_Session):
+    __slots__ = ("seen_ids", "get_id")
+
+    def __init__(
+        self,
+        overrides: dict[type, type[Encoder]] | None,
+        id_provider: Callable[[object], int | str] | None,
+    ):
+        super().__init__(overrides, Encoder._registry)
+        self.seen_ids: set[int | str] = set()
+        self.get_id = MonotonicID() if id_provider is None else id_provider
 
 
 class Encoder(_Transcoder):
     """
     Encoders transform python objects into JSON-compliant data-structures for
-    storage or transmission. All constituent object data is stored in a flat
-    dict keyed by each object's id. The values of the data-dict are lists of
-    two elements: the first node contains the fully-qualified type name of the
-    object's type, and the second contains a serializable representation of its
-    members. The one exception to this pattern is the 'root' node, which
-    contains only the address of the object initially passed to the Encoder.
+    storage or transmission. Each object is encoded as a list of three
+    elements: the fully-qualified type name of the object's type, the object's
+    id, and a serializable representation of its members. Primitives omit the
+    id, and are encoded as [type name, value]. Objects encountered
+    more than once are encoded as references to the id of their first
+    occurrence; the ids seen so far are tracked in a set that is shared by
+    every Encoder of a session.
     Subclasses of Encoder transform data for specific types specified by the
     handler_for class-keyword.
     """
 
+    __slots__ = ("_obj_id", "obj_data")
+
     def __new__(
         cls,
         obj,
@@ -93,9 +213,16 @@ class Encoder(_Transcoder):
             obj: the object to be encoded.
             parent: the Encoder constructing this one, or None if obj is the
             first object to be encoded.
+            overrides: encoders for specific types to use in place of
+            previously registered handlers. Children passing their parent's
+            overrides share its handler resolution.
         """
-        encoder_type = cls._resolve_handler(type(obj), overrides)
-        return super().__new__(encoder_type)
+        session = (
+            _EncodeSession(overrides, id_provider)
+            if parent is None
+            else cls._child_session(parent, overrides)
+        )
+        return cls._new_handler(type(obj), session)
 
     def __init__(
         self,
@@ -113,22 +240,21 @@ class Encoder(_Transcoder):
         """
         self.parent = parent
         self.overrides = overrides
-        if parent is None:
-            self.data: dict[int, str | list[str, Any]] = {}
-            self.get_id = MonotonicID() if id_provider is None else id_provider
-        else:
-            self.data = parent.data
-            self.get_id = parent.get_id
-        self._obj_id = self.get_id(obj)
         self.obj_data = self._pack(obj)
-        if parent is None:
-            self.data[self._obj_id] = self.obj_id
 
     @property
-    def obj_id(self) -> str:
+    def get_id(self) -> Callable[[object], int | str]:
+        """
+        Returns:
+            the id_provider of this Encoder's session.
+        """
+        return self.session.get_id
+
+    @property
+    def obj_id(self) -> int | str | None:
         """
-        The unique identifier for the object being encoded; this should be a
-        string of the id of the object.
+        The unique identifier for the object being encoded, as produced by the
+        session's id_provider. Primitives are not assigned an id.
         Returns:
             the id of the object passed to this Encoder.
         """
@@ -140,23 +266,73 @@ class Encoder(_Transcoder):
 
     def _pack(self, obj) -> list[str, int, Any]:
         obj_type = self._get_obj_type(obj)
-        if self.obj_id in self.data:
-            return Encoder(
-                _ObjectReference(obj), self, self.overrides
-            ).obj_data
+        session = self.session
+        obj_id = self._obj_id = session.get_id(obj)
+        if obj_id in session.seen_ids:
+            return self._pack_reference(obj, obj_id)
         encoded_data = [
             get_fully_qualified_name(obj_type),
-            (self._encode(obj), self.obj_id),
+            obj_id,
+            self._encode(obj),
         ]
-        self.data[self.obj_id] = encoded_data
+        session.seen_ids.add(obj_id)
         return encoded_data
 
     def _encode(self, obj):
         return obj
 
+    def _pack_reference(self, obj, obj_id: int | str) -> list[str, Any]:
+        """
+        Encode a reference to obj, which has already been encoded in this
+        session with obj_id. Unless _ObjectReference's handler is overridden,
+        the reference is packed directly rather than by constructing an
+        Encoder.
+        """
+        session = self.session
+        handler = self._cached_handler(
+            session.handlers, _ObjectReference, session.override_registry
+        )
+        if handler is _ObjectReferenceEncoder:
+            return [_object_reference_name, obj_id, obj_id]
+        return Encoder(_ObjectReference(obj), self, self.overrides).obj_data
+
+    def _pack_child(self, obj) -> list[str, Any]:
+        """
+        Encode a member of the object being encoded by this Encoder. Objects
+        handled by PrimitiveEncoder are packed inline rather than by
+        constructing a child Encoder.
+        Args:
+            obj: the member to be encoded.
+
+        Returns:
+            the encoded data of obj.
+        """
+        obj_type = type(obj)
+        if self._packs_inline(obj_type):
+            return [get_fully_qualified_name(obj_type), obj]
+        return Encoder(obj, self, self.overrides).obj_data
+
+    def _packs_inline(self, obj_type: type) -> bool:
+        """
+        Returns:
+            True if objects of obj_type are handled by PrimitiveEncoder in
+            this session, and may therefore be packed without an Encoder.
+        """
+        session = self.session
+        return (
+            self._cached_handler(
+                session.handlers, obj_type, session.override_registry
+            )
+            is PrimitiveEncoder
+        )
+
 
 class PrimitiveEncoder(Encoder, handler_for=primitives):
+    __slots__ = ()
+
     def _pack(self, obj) -> list[str, int, Any]:
+        # primitives are never referenced, so they are not assigned an id.
+        self._obj_id = None
         obj_type = self._get_obj_type(obj)
         return [
             get_fully_qualified_name(obj_type),
@@ -170,6 +346,8 @@ class Decoder(_Transcoder, handler_for=primitives):
     encoded object.
     """
 
+    __slots__ = ("encoded_data", "locator", "instance", "_unpacked")
+
     def __new__(
         cls,
         encoded_data: dict,
@@ -189,9 +367,16 @@ class Decoder(_Transcoder, handler_for=primitives):
         """
         # if obj_id is None:
         #     obj_id = encoded_data[cls.root_key]
-        attr_type, *_ = cls._unpack(encoded_data, locator)
-        decoder_cls = cls._resolve_handler(attr_type, overrides)
-        return super().__new__(decoder_cls)
+        unpacked = cls._unpack(encoded_data, locator)
+        attr_type, _ = unpacked
+        session = (
+            _DecodeSession(overrides)
+            if parent is None
+            else cls._child_session(parent, overrides)
+        )
+        decoder = cls._new_handler(attr_type, session)
+        decoder._unpacked = unpacked
+        return decoder
 
     def __init__(
         self,
@@ -202,24 +387,32 @@ class Decoder(_Transcoder, handler_for=primitives):
     ):
         self.parent = parent
         self.overrides = overrides
-        if parent is None:
-            self.decoded_objects = {}
-        else:
-            self.decoded_objects = parent.decoded_objects
         self.encoded_data = encoded_data
         self.locator = locator
         self.instance = self.decode()
 
+    @property
+    def decoded_objects(self) -> dict[int | str, Any]:
+        """
+        Returns:
+            the instances decoded so far in this Decoder's session, by id.
+        """
+        return self.session.decoded_objects
+
     def decode(self) -> Any:
-        member_type, (member_data, obj_id) = self._unpack(
-            self.encoded_data, self.locator
-        )
-        try:
-            return self.decoded_objects[obj_id]
-        except KeyError:
-            pass
+        member_type, obj_id = self._unpacked
+        encoded_data = self.encoded_data
+        if len(encoded_data) == 3:
+            member_data = encoded_data[2]
+        else:
+            # the [type name, (members, id)] layout of earlier versions.
+            member_data, obj_id = obj_id
+        decoded_objects = self.session.decoded_objects
+        instance = decoded_objects.get(obj_id, _missing)
+        if instance is not _missing:
+            return instance
         instance = self._decode(member_type, member_data)
-        self.decoded_objects[obj_id] = instance
+        decoded_objects[obj_id] = instance
         return instance
 
     @classmethod
@@ -228,7 +421,8 @@ class Decoder(_Transcoder, handler_for=primitives):
         encoded_data: dict[str, list[str, Any]],
         locator: Locator,
     ) -> tuple[type, Any]:
-        fully_qualified_name, obj_data = encoded_data
+        # [type name, value] for primitives, else [type name, id, members].
+        fully_qualified_name, obj_data = encoded_data[0], encoded_data[1]
         try:
             t = locator(fully_qualified_name)
         except TypeError:
@@ -240,14 +434,48 @@ class Decoder(_Transcoder, handler_for=primitives):
     def _decode(self, obj_type: type, value: Any) -> Any:
         return obj_type(value)
 
+    def _decode_child(self, encoded_data: list[str, Any]) -> Any:
+        """
+        Decode a member of the object being decoded by this Decoder. Objects
+        handled by PrimitiveDecoder are constructed directly rather than by
+        constructing a child Decoder.
+        Args:
+            encoded_data: the encoded data of the member.
+
+        Returns:
+            the decoded member.
+        """
+        obj_type, value = self._unpack(encoded_data, self.locator)
+        session = self.session
+        handler = self._cached_handler(
+            session.handlers, obj_type, session.override_registry
+        )
+        if handler is PrimitiveDecoder:
+            return obj_type(value)
+        return Decoder(
+            encoded_data, self.locator, self, overrides=self.overrides
+        ).instance
+
+
+class _DecodeSession(_Session):
+    __slots__ = ("decoded_objects",)
+
+    def __init__(self, overrides: dict[type, type[Decoder]] | None):
+        super().__init__(overrides, Decoder._registry)
+        self.decoded_objects: dict[int | str, Any] = {}
+
 
 class PrimitiveDecoder(Decoder, handler_for=primitives):
+    __slots__ = ()
+
     def decode(self) -> Any:
-        member_type, value = self._unpack(self.encoded_data, self.locator)
+        member_type, value = self._unpacked
         return self._decode(member_type, value)
 
 
 class _ObjectReference:
+    __slots__ = ("obj",)
+
     def __init__(self, obj: Any):
         while isinstance(obj, _ObjectReference):
             obj = obj.obj
@@ -255,16 +483,31 @@ class _ObjectReference:
 
 
 class _ObjectReferenceEncoder(Encoder, handler_for=_ObjectReference):
+    __slots__ = ()
+
+    def _pack(self, obj_ref: _ObjectReference) -> list[str, int, Any]:
+        # references are transient wrappers whose id() may be recycled, so
+        # they are keyed by their target rather than tracked as seen.
+        obj_id = self._obj_id = self._encode(obj_ref)
+        return [get_fully_qualified_name(_ObjectReference), obj_id, obj_id]
+
     def _encode(self, obj_ref):
         return self.get_id(obj_ref.obj)
 
 
+_object_reference_name = get_fully_qualified_name(_ObjectReference)
+
+
 class _ObjectReferenceDecoder(Decoder, handler_for=_ObjectReference):
+    __slots__ = ()
+
     def _decode(self, obj_type: type, value: Any) -> Any:
         return self.decoded_objects[value]
 
 
 class NoneTypeDecoder(PrimitiveDecoder, handler_for=NoneType):
+    __slots__ = ()
+
     def _decode(self, obj_type: type, value: Any) -> Any:
         return None
 
@@ -323,8 +566,10 @@ def from_string(
 def to_file(
     obj, path: str, overrides: dict[type, type[Encoder]] | None = None
 ):
+    # json.dump always uses the pure-Python encoder; json.dumps uses the C
+    # accelerated one.
     with open(path, "w") as f:
-        json.dump(encode(obj, overrides=overrides), f)
+        f.write(json.dumps(encode(obj, overrides=overrides)))
 
 
 def from_file(
@@ -347,16 +592,22 @@ def decode(
 
 
 class TypeEncoder(PrimitiveEncoder, handler_for=(type, FunctionType)):
+    __slots__ = ()
+
     def _encode(self, obj_type):
         return get_fully_qualified_name(obj_type)
 
 
 class TypeDecoder(PrimitiveDecoder, handler_for=(type, FunctionType)):
+    __slots__ = ()
+
     def _decode(self, _, fully_qualified_name: str):
         return self.locator(fully_qualified_name)
 
 
 class GenericEncoder(TypeEncoder, handler_for=(GenericAlias, _GenericAlias)):
+    __slots__ = ()
+
     @classmethod
     def _get_obj_type(cls, obj):
         return type
@@ -366,88 +617,91 @@ class GenericEncoder(TypeEncoder, handler_for=(GenericAlias, _GenericAlias)):
 
 
 class CollectionEncoder(Encoder, handler_for=(tuple, set, list)):
+    __slots__ = ()
+
     def _encode(self, obj: Collection):
-        return [Encoder(item, self, self.overrides).obj_data for item in obj]
+        item_types = set(map(type, obj))
+        if all(map(self._packs_inline, item_types)):
+            # primitive-only collections are packed in a single pass.
+            names = {t: get_fully_qualified_name(t) for t in item_types}
+            return [[names[type(item)], item] for item in obj]
+        return [self._pack_child(item) for item in obj]
 
 
 class CollectionDecoder(Decoder, handler_for=(tuple, set, list)):
+    __slots__ = ()
+
     def _decode(self, obj_type, obj_data: Collection[Any]):
-        return obj_type(
-            (
-                Decoder(
-                    encoded_obj_data,
-                    self.locator,
-                    self,
-                    overrides=self.overrides,
-                ).instance
-                for encoded_obj_data in obj_data
-            )
-        )
+        return obj_type(map(self._decode_child, obj_data))
 
 
 class DictEncoder(Encoder, handler_for=dict):
+    __slots__ = ()
+
     def _encode(self, obj: dict):
+        if not obj:
+            return []
+        pack_child = self._pack_child
         return [
-            *zip(
-                *(
-                    (
-                        Encoder(obj, self, self.overrides).obj_data
-                        for obj in item
-                    )
-                    for item in obj.items()
-                )
-            )
+            [pack_child(key) for key in obj.keys()],
+            [pack_child(value) for value in obj.values()],
         ]
 
 
 class DictDecoder(Decoder, handler_for=dict):
+    __slots__ = ()
+
     def _decode(self, obj_type: type, items: list[list, list]) -> Any:
-        return (
-            {
-                Decoder(key, self.locator, self, overrides=self.overrides)
-                .instance: Decoder(
-                    item, self.locator, self, overrides=self.overrides
-                )
-                .instance
-                for key, item in zip(*items)
-            }
-            if items
-            else {}
-        )
+        if not items:
+            return {}
+        decode_child = self._decode_child
+        return {
+            decode_child(key): decode_child(item)
+            for key, item in zip(*items)
+        }
 
 
 class EnumEncoder(Encoder, handler_for=Enum):
+    __slots__ = ()
+
     def _encode(self, obj: Enum):
         return obj.name
 
 
 class EnumDecoder(Decoder, handler_for=Enum):
+    __slots__ = ()
+
     def _decode(self, obj_type: type[Enum], value: str) -> Any:
         return obj_type[value]
 
 
 class MethodEncoder(Encoder, handler_for=MethodType):
+    __slots__ = ()
+
     def _encode(self, bound: MethodType):
         return [
-            Encoder(bound.__self__, self, self.overrides).obj_data,
+            self._pack_child(bound.__self__),
             bound.__func__.__name__,
         ]
 
 
 class MethodDecoder(Decoder, handler_for=MethodType):
+    __slots__ = ()
+
     def _decode(self, obj_type: type, value: tuple[list, str]) -> Any:
         instance_data, func_name = value
-        instance = Decoder(
-            instance_data, self.locator, self, self.overrides
-        ).instance
-        return getattr(instance, func_name)
+        return getattr(self._decode_child(instance_data), func_name)
 
 
 class DateTimeEncoder(Encoder, handler_for=datetime):
+    __slots__ = ()
+
     def _encode(self, obj: datetime):
         return obj.timestamp()
 
 
 class DateTimeDecoder(Decoder, handler_for=datetime):
+    __slots__ = ()
+
     def _decode(self, obj_type: datetime, value: Any) -> Any:
         return datetime.fromtimestamp(value)
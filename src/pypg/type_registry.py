@@ -1,5 +1,7 @@
+from abc import get_cache_token
 from collections.abc import Callable
 from typing import TypeVar
+from weakref import WeakKeyDictionary
 
 from pypg.type_utils import find_closest_relative
 
@@ -7,7 +9,35 @@ T = TypeVar("T")
 
 
 class TypeRegistry(dict[type, T]):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # closest relatives by looked-up type, then by constraining base. The
+        # cache is cleared whenever the registry changes, or an ABC registers
+        # a virtual subclass, since either can change the result.
+        self.__relatives: WeakKeyDictionary[type, dict] = WeakKeyDictionary()
+        self.__abc_token = get_cache_token()
+
     def find_closest_relative(self, t, constraining_base: type | None = None):
+        token = get_cache_token()
+        if token != self.__abc_token:
+            self.__relatives.clear()
+            self.__abc_token = token
+        try:
+            by_base = self.__relatives.get(t)
+        except TypeError:
+            # types that cannot be weakly referenced are not cached.
+            return self.__find_closest_relative(t, constraining_base)
+        if by_base is None:
+            by_base = self.__relatives[t] = {}
+        try:
+            return by_base[constraining_base]
+        except KeyError:
+            relative = by_base[constraining_base] = (
+                self.__find_closest_relative(t, constraining_base)
+            )
+            return relative
+
+    def __find_closest_relative(self, t, constraining_base: type | None):
         types_to_compare = (
             (t_i for t_i in self if issubclass(t_i, constraining_base))
             if constraining_base is not None
@@ -15,6 +45,42 @@ class TypeRegistry(dict[type, T]):
         )
         return find_closest_relative(t, *types_to_compare)
 
+    def __setitem__(self, key: type, value: T):
+        super().__setitem__(key, value)
+        self.__relatives.clear()
+
+    def __delitem__(self, key: type):
+        super().__delitem__(key)
+        self.__relatives.clear()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self.__relatives.clear()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.__relatives.clear()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self.__relatives.clear()
+        return result
+
+    def setdefault(self, key: type, default: T = None) -> T:
+        result = super().setdefault(key, default)
+        self.__relatives.clear()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.__relatives.clear()
+
+    def clear(self):
+        super().clear()
+        self.__relatives.clear()
+
     def __getitem__(self, item) -> T:
         if isinstance(item, slice):
             try:
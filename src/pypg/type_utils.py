@@ -1,8 +1,9 @@
 import importlib
-import inspect
 import pkgutil
+from functools import partial
 from types import FunctionType, MethodType, ModuleType
 from typing import Iterable, get_origin
+from weakref import ref
 
 
 def hierarchy(t: type) -> Iterable[type]:
@@ -21,15 +22,34 @@ def find_closest_relative(t: type, *others: type) -> type | None:
     t, *others = unbind_generics(t, *others)
     relatives = (other for other in others if issubclass(t, other))
     try:
-        return max(relatives, key=lambda other: len([*hierarchy(other)]))
+        return max(relatives, key=lambda other: len(other.__mro__))
     except ValueError:
         return None
 
 
+# names by the id() of the named object. A weakref callback drops each entry
+# when its object is collected, so the cache neither keeps objects alive nor
+# serves a name for a recycled id.
+_qualified_names: dict[int, tuple[str, ref]] = {}
+
+
 def get_fully_qualified_name(t: type | FunctionType | MethodType) -> str:
+    try:
+        return _qualified_names[id(t)][0]
+    except KeyError:
+        pass
     if t.__module__ == "builtins":
-        return t.__qualname__
-    return ".".join((t.__module__, t.__qualname__))
+        name = t.__qualname__
+    else:
+        name = ".".join((t.__module__, t.__qualname__))
+    key = id(t)
+    try:
+        forget = partial(_qualified_names.pop, key)
+        _qualified_names[key] = name, ref(t, forget)
+    except TypeError:
+        # objects that cannot be weakly referenced are not cached.
+        pass
+    return name
 
 
 def get_submodules(*modules: ModuleType) -> Iterable[ModuleType]:
@@ -43,6 +63,7 @@ def get_submodules(*modules: ModuleType) -> Iterable[ModuleType]:
 
 def find_types(cls: type | tuple[type], *modules: ModuleType) -> Iterable[type]:
     for m in get_submodules(*modules):
-        for name, obj in inspect.getmembers(m):
-            if inspect.isclass(obj) and issubclass(obj, cls):
+        # types within a module are found in order of name.
+        for _, obj in sorted(vars(m).items()):
+            if isinstance(obj, type) and issubclass(obj, cls):
                 yield obj
@@ -45,5 +45,5 @@ class ConfigTest(TestCase):
 
     def test_to_string(self):
         cdc = CfgDataCls(included=1, excluded=1, excluded_inner=InnerCls(p1=1))
-        json_str = json.dumps(Config.encode(cdc))
-        self.assertEqual(json_str, Config.to_string(cdc))
\ No newline at end of file
+        encoded = Config.encode(cdc)
+        self.assertEqual(encoded, json.loads(Config.to_string(cdc)))
\ No newline at end of file
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from pypg import Locator, allow_subclass, strict
 from pypg import get_fully_qualified_name
@@ -26,14 +26,37 @@ class TestLocator(TestCase):
         locator.allow(Bar)
         self.assertIs(Bar, locator(bar_fqn))
 
+    def test_allow_replaces_located(self):
+        locator = Locator(Foo, load_policy=strict)
+        fqn = get_fully_qualified_name(Foo)
+        self.assertIs(Foo, locator(fqn))
+
+        class Redeclared:
+            pass
+
+        Redeclared.__qualname__ = Foo.__qualname__
+        Redeclared.__module__ = Foo.__module__
+        locator.allow(Redeclared)
+        self.assertIs(Redeclared, locator(fqn))
+
     def test_subclass(self):
         locator = Locator(Foo, load_policy=allow_subclass)
         self.assertIs(Foo, locator(get_fully_qualified_name(Foo)))
         self.assertIs(Bar, locator(get_fully_qualified_name(Bar)))
+        with self.assertRaises(PermissionError):
+            locator(get_fully_qualified_name(TestLocator))
 
     def test_not_found(self):
         with self.assertRaises(TypeError):
             Locator()("asdf")
 
+    def test_lookup_cached(self):
+        locator = Locator()
+        fqn = get_fully_qualified_name(Foo)
+        with mock.patch("pypg.locator._locate", return_value=Foo) as locate:
+            self.assertIs(Foo, locator(fqn))
+            self.assertIs(Foo, locator(fqn))
+        locate.assert_called_once_with(fqn)
+
     def test_none(self):
         self.assertIs(type(None), Locator()(get_fully_qualified_name(type(None))))
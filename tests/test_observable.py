@@ -1,3 +1,7 @@
+import gc
+import weakref
+from threading import Event, Thread
+from time import monotonic, sleep
 from unittest import TestCase
 
 from pypg import PostGet, PostSet, Property, PropertyClass
@@ -38,7 +42,8 @@ class ObservableTest(TestCase):
             self.assertTrue(w0_delivery.await_delivery(2))
             self.assertEqual([0, 1], self.w0_data)
 
-            self.assertFalse(w1_delivery.await_delivery(0))
+            # nothing is pending for w1, so there is nothing to wait for.
+            self.assertTrue(w1_delivery.await_delivery(0))
             self.assertFalse(self.w1_data)
 
             self.w1.p = 1
@@ -81,6 +86,16 @@ class ObservableTest(TestCase):
             for i in range(1, 5):
                 self.assertEqual([self.w0.g] * i, self.w0_data)
 
+    def test_on_change_without_init(self):
+        class Tolerant(OnChange):
+            def __init__(self):
+                self.tolerance = 0
+
+        policy = Tolerant()
+        self.assertTrue(policy.requires_update(1))
+        self.assertFalse(policy.requires_update(1))
+        self.assertTrue(policy.requires_update(2))
+
     def test_error_handling(self):
         ex = RuntimeError()
 
@@ -114,3 +129,91 @@ class ObservableTest(TestCase):
             for i in range(3):
                 expected.append(c.p)
         self.assertEqual(expected, delivered)
+
+    def test_cancel_during_delivery(self):
+        delivered = []
+
+        def cancel_first(value):
+            first.cancel()
+            delivered.append(value)
+
+        first = watch(
+            self.w0, "p", SynchronousDelivery(cancel_first, Always())
+        )
+        with watch(
+            self.w0, "p", SynchronousDelivery(delivered.append, Always())
+        ):
+            self.w0.p = 1
+            self.assertEqual([1, 1], delivered)
+            self.w0.p = 2
+            self.assertEqual([1, 1, 2], delivered)
+
+    def test_delivery_thread_exits_when_idle(self):
+        delivery = AsynchronousDelivery(
+            self.w0_data.append, Always(), idle_timeout=0.05
+        )
+        delivery.update(1)
+        thread = delivery._delivery_thread
+        self.assertTrue(delivery.await_delivery(2))
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([1], self.w0_data)
+
+        # an idle policy is not kept alive by its delivery thread.
+        delivery_ref = weakref.ref(delivery)
+        del delivery
+        gc.collect()
+        self.assertIsNone(delivery_ref())
+
+    def test_delivery_thread_persists_between_bursts(self):
+        delivery = AsynchronousDelivery(
+            self.w0_data.append, Always(), idle_timeout=None
+        )
+        delivery.update(1)
+        thread = delivery._delivery_thread
+        self.assertTrue(delivery.await_delivery(2))
+        sleep(0.05)
+        delivery.update(2)
+        self.assertIs(thread, delivery._delivery_thread)
+        self.assertTrue(delivery.await_delivery(2))
+        self.assertEqual([1, 2], self.w0_data)
+        delivery.cancel()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+
+    def test_await_delivery_after_cancel(self):
+        delivery = AsynchronousDelivery(self.w0_data.append, Always())
+        delivery.update(1)
+        thread = delivery._delivery_thread
+        delivery.cancel()
+        self.assertTrue(delivery.await_delivery(0))
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        delivery.update(2)
+        self.assertIsNone(delivery._delivery_thread)
+
+    def test_await_delivery_canceled_while_waiting(self):
+        delivering, proceed = Event(), Event()
+
+        def slow_append(value):
+            delivering.set()
+            proceed.wait(2)
+            self.w0_data.append(value)
+
+        delivery = AsynchronousDelivery(slow_append, Always())
+        delivery.update(1)
+        self.assertTrue(delivering.wait(2))
+        awaited = []
+        waiter = Thread(
+            target=lambda: awaited.append(delivery.await_delivery(3))
+        )
+        waiter.start()
+        # the waiter's marker is queued behind the value being delivered, and
+        # is dequeued only after cancellation.
+        deadline = monotonic() + 2
+        while delivery._data_queue.empty() and monotonic() < deadline:
+            sleep(0.001)
+        delivery.cancel()
+        proceed.set()
+        waiter.join(1)
+        self.assertEqual([True], awaited)
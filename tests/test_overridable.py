@@ -1,4 +1,7 @@
-from threading import Event, Thread
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
 from unittest import TestCase
 
 from pypg import MethodReference, PreSet, Property, PropertyClass
@@ -93,19 +96,20 @@ class TestOverridable(TestCase):
             finally:
                 main_coordinator.set()
 
-        separate_thread = Thread(target=bgworker)
-        separate_thread.start()
-        with OverrideTester.p_validation.override(ot):
-            # this thread has overrides, background does not
-            ot.p = -2
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            bg_result = executor.submit(bgworker)
+            with OverrideTester.p_validation.override(ot):
+                # this thread has overrides, background does not
+                ot.p = -2
+                bg_coordinator.set()
+                main_coordinator.wait()
+                main_coordinator.clear()
+            # bg thread has override, this does not
+            with self.assertRaises(ValueError):
+                ot.p = -1
             bg_coordinator.set()
-            main_coordinator.wait()
-            main_coordinator.clear()
-        # bg thread has override, this does not
-        with self.assertRaises(ValueError):
-            ot.p = -1
-        bg_coordinator.set()
-        separate_thread.join()
+            # re-raises any assertion failure from the background thread.
+            bg_result.result()
 
     def test_override_all(self):
         with Validated.override_all(OverrideTester):
@@ -118,3 +122,14 @@ class TestOverridable(TestCase):
             ot.p = -2
             with self.assertRaises(ValueError):
                 ot2.p = -1
+
+    def test_override_all_does_not_retain_types(self):
+        class Transient(PropertyClass):
+            p = Property[float](default=0, traits=Validated[PreSet](abs))
+
+        with Validated.override_all(Transient):
+            Transient(p=-1)
+        transient = weakref.ref(Transient)
+        del Transient
+        gc.collect()
+        self.assertIsNone(transient())
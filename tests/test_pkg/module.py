@@ -4,3 +4,7 @@ class Sentinel:
 
 class Subcls(Sentinel):
     pass
+
+
+class Derived(Subcls):
+    pass
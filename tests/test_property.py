@@ -104,3 +104,72 @@ class PropertyTest(TestCase):
             C(**cfg)
         except TypeError as te:
             self.assertIn(str(invalid), str(te))
+
+    def test_unhashable_init(self):
+        class C(PropertyClass):
+            a = Property[int](default=1)
+
+            def __eq__(self, other):
+                return self.a == other.a
+
+        self.assertEqual(C(), C(a=1))
+
+    def test_direct_init_inheritance(self):
+        class Base(PropertyClass):
+            a = Property[int](default=1)
+
+        class Factory(Base):
+            b = Property[list](default=lambda _: [])
+
+        class Custom(Base):
+            c = Property[int](default=3)
+
+            def __init__(self, **config):
+                super().__init__(**config)
+                self.initialized_a = self.a
+
+        class Literal(Base):
+            d = Property[int](default=4)
+
+        self.assertEqual((1, []), (Factory().a, Factory().b))
+        self.assertIsNot(Factory().b, Factory().b)
+        custom = Custom(a=2)
+        self.assertEqual((2, 3, 2), (custom.a, custom.c, custom.initialized_a))
+        self.assertEqual((5, 4), (Literal(a=5).a, Literal().d))
+
+    def test_shadowed_property_init(self):
+        class Base(PropertyClass):
+            x = Property[int](default=1)
+
+        class Shadowing(Base):
+            x = Property[int](default=2)
+
+            def __init__(self, **config):
+                super().__init__(**config)
+
+        self.assertEqual((5, 2), (Shadowing(x=5).x, Shadowing().x))
+
+    def test_init_through_setattr(self):
+        class Logged(PropertyClass):
+            a = Property[int](default=1)
+
+            def __setattr__(self, name, value):
+                self.__dict__.setdefault("log", []).append(name)
+                super().__setattr__(name, value)
+
+        self.assertEqual(["a"], Logged(a=2).log)
+
+    def test_init_through_shadowing_attribute(self):
+        class Base(PropertyClass):
+            a = Property[int](default=1)
+
+        class Sub(Base):
+            @property
+            def a(self):
+                return self.stored
+
+            @a.setter
+            def a(self, value):
+                self.stored = value * 2
+
+        self.assertEqual(14, Sub(a=7).a)
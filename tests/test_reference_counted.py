@@ -1,3 +1,4 @@
+import gc
 from unittest import TestCase
 
 from pypg import Property, PropertyClass
@@ -7,9 +8,11 @@ from pypg.traits.reference_counted import ReferenceCounted
 class Composed(ReferenceCounted):
     i = Property[int](0)
     flag = Property[bool](False)
+    unreferenced_count = Property[int](0)
 
     def _on_unreferenced(self):
         self.flag = True
+        self.unreferenced_count += 1
 
 
 class Composer(PropertyClass):
@@ -29,3 +32,24 @@ class TestReferenceCounted(TestCase):
             ref_set.remove(c)
             self.assertEqual(ref_set, composed.composed_by)
         self.assertTrue(composed.flag)
+
+    def test_composers_held_weakly(self):
+        composed = Composed()
+        composer = Composer(prop=composed)
+        self.assertEqual(1, composed.reference_count)
+        del composer
+        gc.collect()
+        self.assertEqual(0, composed.reference_count)
+        self.assertTrue(composed.flag)
+        self.assertEqual(1, composed.unreferenced_count)
+
+    def test_unreferenced_once(self):
+        composed = Composed()
+        composer = Composer(prop=composed)
+        composer.prop = None
+        self.assertEqual(1, composed.unreferenced_count)
+        with self.assertRaises(KeyError):
+            composed._dereference(composer)
+        del composer
+        gc.collect()
+        self.assertEqual(1, composed.unreferenced_count)
@@ -1,5 +1,7 @@
+import gc
 import os
 import tempfile
+import weakref
 from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
@@ -17,7 +19,14 @@ from pypg import (
     encode,
 )
 from pypg.traits.config import Config
-from pypg.transcode import from_file, from_string, to_file, to_string, Decoder
+from pypg.transcode import (
+    from_file,
+    from_string,
+    to_file,
+    to_string,
+    Decoder,
+    PrimitiveEncoder,
+)
 
 
 class TestClass(PropertyClass):
@@ -57,6 +66,14 @@ def free_function():
     pass
 
 
+class ShadowedBase(PropertyClass):
+    x = Property[int](default=1)
+
+
+class Shadowing(ShadowedBase):
+    x = Property[int](default=2)
+
+
 class TranscoderTest(TestCase):
     def test_registration(self):
         self.assertIs(DictEncoder, Encoder[dict])
@@ -121,6 +138,58 @@ class TranscoderTest(TestCase):
         )
         self.assertEqual("asdf", asdf)
 
+    def test_encode_override_in_collection(self):
+        class IntAsStr(PrimitiveEncoder):
+            def _encode(self, obj):
+                return str(obj)
+
+        [_, _, items] = encode([1, 2, "a"], overrides={int: IntAsStr})
+        self.assertEqual(["1", "2", "a"], [value for _, value in items])
+
+    def test_child_overrides(self):
+        class IntAsStr(PrimitiveEncoder):
+            def _encode(self, obj):
+                return str(obj)
+
+        child_overrides = {int: IntAsStr}
+
+        class TupleOfStrs(Encoder):
+            def _encode(self, obj):
+                return [
+                    Encoder(item, self, child_overrides).obj_data
+                    for item in obj
+                ]
+
+        shared = [3]
+        [_, _, [one, [_, _, [two, first]], second]] = encode(
+            [1, (2, shared), shared], overrides={tuple: TupleOfStrs}
+        )
+        # the child's overrides apply only beneath it...
+        self.assertEqual(["int", 1], one)
+        self.assertEqual(["int", "2"], two)
+        # ...while ids are still shared with the rest of the encoding.
+        [_, shared_id, _] = first
+        self.assertEqual(
+            ["pypg.transcode._ObjectReference", shared_id, shared_id], second
+        )
+
+    def test_decode_paired_layout(self):
+        # data encoded as [type name, [members, id]] by earlier versions.
+        encoded = [
+            "list",
+            [
+                [
+                    ["list", [[["float", 1.0]], 1]],
+                    ["pypg.transcode._ObjectReference", [1, 1]],
+                    ["dict", [[[["str", "a"]], [["NoneType", None]]], 2]],
+                ],
+                0,
+            ],
+        ]
+        copy = decode(encoded)
+        self.assertEqual([[1.0], [1.0], {"a": None}], copy)
+        self.assertIs(copy[0], copy[1])
+
     def test_enum_transcoding(self):
         e = EnumTest.E.A
         encoded = encode(e)
@@ -134,10 +203,8 @@ class TranscoderTest(TestCase):
 
     def test_reference_interning(self):
         ex = LargeCollectionExample(
-            list_prop=[
-                *[Data(value="hello")] * 10000,
-                *[Data(value="world")] * 10000,
-            ]
+            list_prop=[Data(value="hello")] * 10000
+            + [Data(value="world")] * 10000
         )
         # In-Memory Round-Trip
         serialized = Config.encode(ex)
@@ -164,7 +231,24 @@ class TranscoderTest(TestCase):
     def test_id_provider(self):
         obj = Data(value='test')
         serialized = encode(obj, id_provider=id)
-        [_, [_, obj_id]] = serialized
+        [_, obj_id, _] = serialized
         self.assertEqual(obj_id, id(obj))
         copy = decode(serialized)
-        self.assertEqual(obj.value, copy.value)
\ No newline at end of file
+        self.assertEqual(obj.value, copy.value)
+
+    def test_shadowed_property_transcoding(self):
+        obj = Shadowing(x=5)
+        copy = decode(encode(obj))
+        self.assertIsInstance(copy, Shadowing)
+        self.assertEqual(5, copy.x)
+
+    def test_encoding_does_not_retain_types(self):
+        class Transient(PropertyClass):
+            x = Property[int](default=1)
+
+        encode(Transient())
+        Config.encode(Transient())
+        transient = weakref.ref(Transient)
+        del Transient
+        gc.collect()
+        self.assertIsNone(transient())
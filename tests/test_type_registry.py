@@ -1,3 +1,6 @@
+import gc
+import weakref
+from abc import ABC
 from unittest import TestCase
 
 from pypg import TypeRegistry
@@ -81,3 +84,28 @@ class TypeRegistryTest(TestCase):
             pass
 
         self.assertIs(treg[Bar], int)
+
+    def test_virtual_subclass_lookup(self):
+        class Interface(ABC):
+            pass
+
+        class Implementation:
+            pass
+
+        treg = TypeRegistry({Interface: "interface"})
+        with self.assertRaises(KeyError):
+            treg[Implementation:]
+        Interface.register(Implementation)
+        self.assertEqual("interface", treg[Implementation:])
+
+    def test_lookup_does_not_retain_types(self):
+        treg = TypeRegistry({Base: "base"})
+
+        class Transient(Base):
+            pass
+
+        self.assertEqual("base", treg[Transient:])
+        transient = weakref.ref(Transient)
+        del Transient
+        gc.collect()
+        self.assertIsNone(transient())
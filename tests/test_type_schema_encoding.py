@@ -15,17 +15,17 @@ class TypeSchemaEncodingTest(TestCase):
     def test_property_type_encoding(self):
         enc = encode(ComplexExample)
         pprint(enc)
-        fqn, (data, type_id) = enc
+        fqn, type_id, data = enc
         self.assertEqual(fqn, get_fully_qualified_name(ComplexExample))
-        a_fqn, (a_data, a_id) = data['a']
+        a_fqn, a_id, a_data = data['a']
         self.assertEqual(a_fqn, get_fully_qualified_name(type(ComplexExample.a)))
         self.assertEqual(a_data['value_type'], encode(float))
         self.assertEqual(a_data['traits'], [])
-        d_fqn, (d_data, d_id) = data['d']
+        d_fqn, d_id, d_data = data['d']
         d_traits = d_data['traits']
-        d_trait_types = {trait_type: data for trait_type, data in d_traits}
+        d_trait_types = {trait_type: data for trait_type, _, data in d_traits}
         self.assertIn(get_fully_qualified_name(Observable), d_trait_types)
-        d_unit, d_unit_id = d_trait_types[get_fully_qualified_name(Unit)]
+        d_unit = d_trait_types[get_fully_qualified_name(Unit)]
         d_unit_data = d_unit['value']
         self.assertEqual(['str',"mm"], d_unit_data)
 
@@ -1,6 +1,8 @@
+import gc
+import weakref
 from unittest import TestCase
 
-from pypg import get_submodules, find_types
+from pypg import find_types, get_fully_qualified_name, get_submodules
 from tests import test_pkg
 from tests.test_pkg.module import Sentinel
 
@@ -19,7 +21,34 @@ class TypeDiscoveryTests(TestCase):
             {
                 test_pkg.module.Sentinel,
                 test_pkg.module.Subcls,
+                test_pkg.module.Derived,
                 test_pkg.subpkg.submodule.SubmoduleTest,
             },
             results,
         )
+
+    def test_find_types_sorted_by_name(self):
+        # types within a module are found in order of name, not definition.
+        results = [*find_types(Sentinel, test_pkg)][:3]
+        self.assertEqual(
+            [
+                test_pkg.module.Derived,
+                test_pkg.module.Sentinel,
+                test_pkg.module.Subcls,
+            ],
+            results,
+        )
+
+
+class QualifiedNameTests(TestCase):
+    def test_name_cache_does_not_retain_types(self):
+        class Transient:
+            pass
+
+        name = f"{__name__}.{Transient.__qualname__}"
+        self.assertEqual(name, get_fully_qualified_name(Transient))
+        self.assertEqual(name, get_fully_qualified_name(Transient))
+        transient = weakref.ref(Transient)
+        del Transient
+        gc.collect()
+        self.assertIsNone(transient())